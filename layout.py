@@ -1,3 +1,11 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+import img2pdf
+import numpy as np
 from PIL import Image
 from PIL.Image import Resampling
 from tqdm import tqdm
@@ -8,6 +16,11 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional, Pillow's resampler is the fallback
+    cv2 = None
+
 """
 A4 Size: 210 mm x 297 mm
 MTG Size: 63.5 mm x 88.9 mm
@@ -23,9 +36,41 @@ A4 Pixels: 595 x 842
 MTG Correct Pixels: 179.91 x 252.03
 """
 
+
+@lru_cache(maxsize=None)
+def _mm_to_px(mm: float, dpi: int) -> int:
+    """Convert a length in millimetres to whole pixels at the given DPI."""
+    return int(mm / Layout.MM_PER_INCH * dpi)
+
+
+def _resize_pil(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Lanczos resize through Pillow (SIMD accelerated when pillow-simd is installed)."""
+    return img.resize(size, Resampling.LANCZOS)
+
+
+def _resize_cv2(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Resize through OpenCV's vectorized kernels.
+
+    INTER_LANCZOS4 does not antialias, so shrinking uses INTER_AREA to avoid
+    moiré; Lanczos is only used for enlarging. The image is converted to RGB
+    first because np.asarray() ignores palette, CMYK and 1-bit modes.
+    """
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    shrinking = size[0] < img.width or size[1] < img.height
+    interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LANCZOS4
+    return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interpolation))
+
+
+# Picked once at import time so _resize_image doesn't branch per card
+RESIZER = _resize_cv2 if cv2 is not None else _resize_pil
+
 class Layout:
     MM_PER_INCH = 25.4
     A4_W_MM, A4_H_MM = 210, 297  # Standard A4 dimensions
+    JPEG_QUALITY = 85                # Page encoding quality inside the PDF
+    RESIZE_TOLERANCE_PX = 3          # Max size mismatch for the cheap bilinear resize
+    ENCODE_WORKERS = min(4, os.cpu_count() or 1)  # Parallel page encoders (bounds raw pages in memory)
 
     def __init__(self, images: list[tuple[Image.Image, int]], config: LayoutConfig = None):
         """Initialize Layout with images and optional configuration.
@@ -39,6 +84,7 @@ class Layout:
 
         self.images = images
         self.config = config
+        self.total_cards = sum(count for _, count in images)  # Including duplicates
 
         # Calculate dimensions from config (using percentage-based card size)
         self.dpi = config.dpi
@@ -49,68 +95,167 @@ class Layout:
         self.side_margin_mm = config.side_margin_mm
 
         # Convert mm to pixels based on DPI
-        self.mtg_w = int(self.card_w_mm / self.MM_PER_INCH * self.dpi)
-        self.mtg_h = int(self.card_h_mm / self.MM_PER_INCH * self.dpi)
-        self.gap_px = int(self.gap_mm / self.MM_PER_INCH * self.dpi)
-        self.top_margin_px = int(self.top_margin_mm / self.MM_PER_INCH * self.dpi)
-        self.side_margin_px = int(self.side_margin_mm / self.MM_PER_INCH * self.dpi)
-        self.page_w = int(self.A4_W_MM / self.MM_PER_INCH * self.dpi)
-        self.page_h = int(self.A4_H_MM / self.MM_PER_INCH * self.dpi)
+        self.mtg_w, self.mtg_h = self.card_size_px(config)
+        self.gap_px = _mm_to_px(self.gap_mm, self.dpi)
+        self.top_margin_px = _mm_to_px(self.top_margin_mm, self.dpi)
+        self.side_margin_px = _mm_to_px(self.side_margin_mm, self.dpi)
+        self.page_w = _mm_to_px(self.A4_W_MM, self.dpi)
+        self.page_h = _mm_to_px(self.A4_H_MM, self.dpi)
 
         self.a4_dimensions = (self.page_w, self.page_h)
         self.mtg_dimensions = (self.mtg_w, self.mtg_h)
 
-        self.pages = [self._create_a4()]
+        # Grid capacity: cards must fit between the side margins horizontally
+        # and between the top margin and the page edge vertically
+        self.cols = max(1, (self.page_w - 2 * self.side_margin_px + self.gap_px) // (self.mtg_w + self.gap_px))
+        self.rows = max(1, (self.page_h - self.top_margin_px + self.gap_px) // (self.mtg_h + self.gap_px))
+        self.cards_per_page = self.cols * self.rows
+
+        self._specialize_resize()
+
+        self.pages: list[bytes] = []  # JPEG-encoded pages, filled by _generate_pages
 
         logger.info(f"Layout initialized: {len(images)} images, card size {self.card_w_mm:.1f}x{self.card_h_mm:.1f}mm, {self.dpi} DPI")
 
+    @staticmethod
+    def card_size_px(config: LayoutConfig) -> tuple[int, int]:
+        """Return the printed card size in pixels for a layout configuration."""
+        return (_mm_to_px(config.get_card_width_mm(), config.dpi),
+                _mm_to_px(config.get_card_height_mm(), config.dpi))
+
     def _create_a4(self):
-        return Image.new('RGB',
-                  self.a4_dimensions,
-                  (255, 255, 255))  # White
+        return np.full((self.page_h, self.page_w, 3), 255, dtype=np.uint8)  # White
 
     def _resize_image(self, img: Image.Image):
-        return img.resize(self.mtg_dimensions, Resampling.LANCZOS)
-
-
+        return RESIZER(img, self.mtg_dimensions)
+
+    def _specialize_resize(self):
+        """Bind a cheaper resize when every source image already (nearly) matches the card size."""
+        sizes = {img.size for img, _ in self.images}
+        if sizes == {self.mtg_dimensions}:
+            self._resize_image = lambda img: img
+            logger.debug("Source images match card size, skipping resize")
+        elif sizes and all(
+            abs(w - self.mtg_w) <= self.RESIZE_TOLERANCE_PX and abs(h - self.mtg_h) <= self.RESIZE_TOLERANCE_PX
+            for w, h in sizes
+        ):
+            # A few pixels of scaling is invisible at print DPI, bilinear is plenty
+            self._resize_image = lambda img: img.resize(self.mtg_dimensions, Resampling.BILINEAR)
+            logger.debug("Source images within tolerance of card size, using bilinear resize")
+
+
+
+    def _prepare_tile(self, img: Image.Image) -> np.ndarray:
+        """Resize one card image into a contiguous RGB tile array."""
+        img = self._resize_image(img)
+        # Materialize the RGB tile once so duplicates paste from loaded pixels
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.load()
+        return np.ascontiguousarray(np.asarray(img))
+
+    def _prepare_tiles(self) -> np.ndarray:
+        """Resize all unique card images in parallel (Pillow/OpenCV release the GIL).
+
+        Returns:
+            One contiguous (n_unique, mtg_h, mtg_w, 3) array of card tiles
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            tiles = list(pool.map(self._prepare_tile, (img for img, _ in self.images)))
+        if not tiles:
+            return np.empty((0, self.mtg_h, self.mtg_w, 3), dtype=np.uint8)
+        return np.stack(tiles)
 
     def _get_images(self):
-        for img, count in self.images:
-            img = self._resize_image(img)
+        tiles = self._prepare_tiles()
+        for tile, (_, count) in zip(tiles, self.images):
             for _ in range(count):
-                yield img
+                yield tile
 
 
     def _generate_pages(self):
         """Generate A4 pages by arranging card images in grid layout.
 
         Places cards in rows and columns, respecting margins and gaps.
-        Creates new pages as needed.
+        Each card's page, row and column follow directly from its index.
+        Finished pages are JPEG-encoded on a small thread pool while layout
+        continues; at most ENCODE_WORKERS raw page buffers are alive at once.
         """
-        logger.info(f"Generating pages for {self._count_total_cards()} cards")
-        pos = [self.side_margin_px, self.top_margin_px]
+        total_cards = self.total_cards
+        logger.info(f"Generating pages for {total_cards} cards")
+
+        stride_x = self.mtg_w + self.gap_px
+        n_pages = max(1, -(-total_cards // self.cards_per_page))
+        self.pages = [b""] * n_pages
+        page = self._create_a4()
+        # Cards of one row are composed into a cache-friendly strip first,
+        # then copied into the page with a single contiguous block write
+        strip = np.full((self.mtg_h, self.page_w, 3), 255, dtype=np.uint8)
         card_count = 0
-
-        for img in tqdm(self._get_images(), desc="Laying out cards on pages", unit="card"):
-            card_count += 1
-
-            if pos[0] + self.mtg_w > self.page_w - self.side_margin_px:  # No more space horizontally
-                pos[0] = self.side_margin_px                # Move to the beginning with side margin
-                pos[1] += self.mtg_h + self.gap_px          # Add another row
-            if pos[1] + self.mtg_h > self.page_h:          # No more space vertically
-                self.pages.append(self._create_a4())        # Create a new page
-                logger.debug(f"Created page {len(self.pages)}")
-                pos = [self.side_margin_px, self.top_margin_px]  # Draw on that page with margins
-
-            self.pages[-1].paste(img, (pos[0], pos[1]))
-            pos[0] += self.mtg_w + self.gap_px
-
+        row = 0
+
+        pending = deque()  # (page index, raw buffer, encode future)
+
+        # Progress is reported once per finished row instead of per card
+        with ThreadPoolExecutor(max_workers=self.ENCODE_WORKERS) as pool, \
+                tqdm(total=total_cards, desc="Laying out cards on pages", unit="card", mininterval=0.25) as bar:
+            for i, tile in enumerate(self._get_images()):
+                card_count += 1
+                slot = i % self.cards_per_page
+                if slot % self.cols == 0 and i:
+                    self._commit_strip(page, strip, row)
+                    bar.update(i - bar.n)
+                    if slot == 0:
+                        self._submit_page(pool, pending, page, i // self.cards_per_page - 1)
+                        page = self._next_buffer(pending)
+                row, col = divmod(slot, self.cols)
+                x = self.side_margin_px + col * stride_x
+                visible_w = min(self.mtg_w, self.page_w - x)  # Oversized cards are cropped at the page edge
+                if visible_w > 0:
+                    strip[:, x:x + visible_w] = tile[:, :visible_w]
+
+            if card_count:
+                self._commit_strip(page, strip, row)
+                bar.update(card_count - bar.n)
+            self._submit_page(pool, pending, page, n_pages - 1)
+            while pending:
+                self._collect_page(pending)
         logger.info(f"Generated {len(self.pages)} page(s) with {card_count} card(s)")
         return self
 
-    def _count_total_cards(self) -> int:
-        """Count total number of card instances (including duplicates)."""
-        return sum(count for _, count in self.images)
+    def _commit_strip(self, page: np.ndarray, strip: np.ndarray, row: int):
+        """Copy a finished row strip into the page and clear it for the next row."""
+        y = self.top_margin_px + row * (self.mtg_h + self.gap_px)
+        visible_h = min(self.mtg_h, self.page_h - y)  # Cropped at the bottom edge, like paste() did
+        if visible_h > 0:
+            page[y:y + visible_h] = strip[:visible_h]
+        strip.fill(255)
+
+    def _submit_page(self, pool: ThreadPoolExecutor, pending: deque, page: np.ndarray, index: int):
+        """Queue a finished page for JPEG encoding (libjpeg releases the GIL)."""
+        pending.append((index, page, pool.submit(self._encode_page, page)))
+
+    def _collect_page(self, pending: deque) -> np.ndarray:
+        """Store the oldest encoded page and return its now free raw buffer."""
+        index, page, future = pending.popleft()
+        self.pages[index] = future.result()
+        logger.debug(f"Encoded page {index + 1}/{len(self.pages)}")
+        return page
+
+    def _next_buffer(self, pending: deque) -> np.ndarray:
+        """Return a blank page buffer, recycling one once the encode pool is saturated."""
+        if len(pending) < self.ENCODE_WORKERS:
+            return self._create_a4()
+        page = self._collect_page(pending)
+        page.fill(255)
+        return page
+
+    def _encode_page(self, page: np.ndarray) -> bytes:
+        """Encode a page as JPEG so img2pdf can embed it without re-encoding."""
+        img = Image.fromarray(page)
+        buf = BytesIO()
+        img.save(buf, "JPEG", quality=self.JPEG_QUALITY, optimize=True, dpi=(self.dpi, self.dpi))
+        return buf.getvalue()
 
     def _save_pdf(self, path="output/cards.pdf"):
         """Save all pages to a PDF file.
@@ -119,9 +264,9 @@ class Layout:
             path: Output PDF file path
         """
         logger.info(f"Saving PDF to {path}")
-        self.pages[0].save(
-            path, "PDF", resolution=self.dpi, save_all=True, append_images=self.pages[1:]
-        )
+        layout_fun = img2pdf.get_fixed_dpi_layout_fun((self.dpi, self.dpi))
+        with open(path, "wb") as f:
+            img2pdf.convert(self.pages, layout_fun=layout_fun, outputstream=f)
         logger.info(f"PDF saved successfully: {path}")
 
     def generate_pdf(self, path="output/cards.pdf"):
@@ -1,16 +1,19 @@
+import os
 import sys
 import argparse
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from layout import Layout
-from mtg import Downloader
 from config import MTGProxyConfig
 from deck_loader import load_deck
 from logging_config import setup_logging, get_logger
 
 __version__ = "0.1.0"
 
+DECK_SUFFIXES = {".yaml", ".yml", ".dec", ".txt"}
+
 # Initialize logging
 _logger = get_logger(__name__)
 
@@ -27,6 +30,7 @@ Examples:
   python main.py -i deck.yaml -o proxies.pdf           # CLI mode
   python main.py -i deck.dec -o output.pdf --verbose   # CLI with verbose
   python main.py --input ramp.yaml --output-dir ./pdfs/ # Custom output dir
+  python main.py --batch decks/ --output-dir ./pdfs/    # One PDF per deck
         """.strip()
     )
 
@@ -50,6 +54,22 @@ Examples:
         help="Output PDF file path (default: deck_name.pdf)"
     )
 
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        type=Path,
+        metavar="PATH",
+        help="Generate one PDF per deck file; directories are scanned for deck files"
+    )
+
+    parser.add_argument(
+        "--image-format",
+        choices=("png", "large"),
+        default="png",
+        help="Scryfall image version: png (full resolution, default) or large "
+             "(~10x smaller JPEGs, faster downloads, slightly soft at 300 DPI)"
+    )
+
     parser.add_argument(
         "--output-dir",
         dest="output_dir",
@@ -112,6 +132,10 @@ def _print_error(message: str):
 
 def run_cli(args):
     """Execute CLI mode: generate PDF from deck file."""
+    # Imported here so --help/--version and GUI startup skip Pillow, numpy and requests
+    from layout import Layout
+    from mtg import Downloader
+
     # Validate required argument for CLI
     if not args.deck_file:
         _print_error("CLI mode requires --input (deck file). Use --gui for GUI mode.")
@@ -135,8 +159,7 @@ def run_cli(args):
         sys.exit(1)
 
     # Determine output file
-    # CLI --output-dir overrides config, otherwise use config's default_dir
-    output_dir = args.output_dir if args.output_dir != Path.cwd() else config.output.default_dir
+    output_dir = _resolve_output_dir(args, config)
 
     if args.output_file:
         output_path = Path(args.output_file)
@@ -170,7 +193,8 @@ def run_cli(args):
 
     _print_step(2, TOTAL_STEPS, "Downloading card images...")
     try:
-        downloader = Downloader(deck)
+        downloader = Downloader(deck, image_format=args.image_format,
+                                draft_size=Layout.card_size_px(config.layout))
         downloaded = downloader.download_all()
     except Exception as e:
         _print_error(f"Failed to download cards: {e}")
@@ -198,6 +222,108 @@ def run_cli(args):
     _print_success(f"PDF saved to {output_path}")
 
 
+def _resolve_output_dir(args, config) -> Path:
+    """CLI --output-dir overrides config, otherwise use config's default_dir."""
+    return args.output_dir if args.output_dir != Path.cwd() else config.output.default_dir
+
+
+def _collect_deck_files(paths: list[Path]) -> list[Path]:
+    """Expand directories into the deck files they contain, keeping explicit files as given.
+
+    A deck named both explicitly and through its directory is only built once.
+    """
+    decks = {}
+    for path in paths:
+        found = sorted(p for p in path.iterdir() if p.suffix.lower() in DECK_SUFFIXES) if path.is_dir() else [path]
+        for deck in found:
+            decks.setdefault(deck.resolve(), deck)
+    return list(decks.values())
+
+
+def _batch_output_paths(deck_files: list[Path], output_dir: Path) -> dict[Path, list[Path]]:
+    """Map each output PDF to the deck files that would write it."""
+    outputs: dict[Path, list[Path]] = {}
+    for deck_file in deck_files:
+        outputs.setdefault(output_dir / deck_file.with_suffix(".pdf").name, []).append(deck_file)
+    return outputs
+
+
+def _build_pdf(downloaded, layout_config, output_path: Path) -> Path:
+    """Lay out downloaded cards and save the PDF (runs in a worker process)."""
+    from layout import Layout
+
+    Layout(downloaded, config=layout_config).generate_pdf(output_path)
+    return output_path
+
+
+def run_batch(args):
+    """Execute batch mode: generate one PDF per deck file.
+
+    Downloads run in this process so all decks share the Scryfall rate
+    limit; layout and PDF encoding run in parallel worker processes.
+    """
+    from layout import Layout
+    from mtg import Downloader
+
+    if args.deck_file or args.output_file:
+        _print_error("--batch cannot be combined with --input/--output; use --output-dir for batch output.")
+        sys.exit(1)
+
+    _print_header()
+
+    try:
+        config = MTGProxyConfig.load(args.config_file)
+    except Exception as e:
+        _print_error(f"Failed to load config: {e}")
+        sys.exit(1)
+
+    deck_files = _collect_deck_files(args.batch)
+    missing = [p for p in deck_files if not p.exists()]
+    if missing:
+        _print_error(f"Deck file(s) not found: {', '.join(map(str, missing))}")
+        sys.exit(1)
+    if not deck_files:
+        _print_error("No deck files found for --batch")
+        sys.exit(1)
+
+    output_dir = _resolve_output_dir(args, config)
+    outputs = _batch_output_paths(deck_files, output_dir)
+    # Two decks writing the same PDF from parallel workers would clobber each other
+    collisions = {out: decks for out, decks in outputs.items() if len(decks) > 1}
+    if collisions:
+        for out, decks in collisions.items():
+            _print_error(f"{out} would be written by {', '.join(map(str, decks))}")
+        print("Rename the decks or run them in separate batches.", file=sys.stderr)
+        sys.exit(1)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {}
+        for step, deck_file in enumerate(deck_files, 1):
+            _print_step(step, len(deck_files), f"Preparing {deck_file.name}...")
+            try:
+                downloader = Downloader(load_deck(deck_file), image_format=args.image_format,
+                                        draft_size=Layout.card_size_px(config.layout))
+                downloaded = downloader.download_all()
+            except Exception as e:
+                _print_error(f"{deck_file}: {e}")
+                failed.append(deck_file)
+                continue
+            output_path = output_dir / deck_file.with_suffix(".pdf").name  # Unique, checked above
+            futures[pool.submit(_build_pdf, downloaded, config.layout, output_path)] = deck_file
+
+        for future, deck_file in futures.items():
+            try:
+                _print_success(f"PDF saved to {future.result()}")
+            except Exception as e:
+                _print_error(f"{deck_file}: {e}")
+                failed.append(deck_file)
+
+    if failed:
+        sys.exit(1)
+
+
 def run_gui():
     """Launch the graphical user interface."""
     try:
@@ -231,10 +357,14 @@ def main():
     if args.gui:
         _logger.info("Launching GUI mode")
         run_gui()
+    elif args.batch:
+        _logger.info(f"Running batch mode for {len(args.batch)} path(s)")
+        run_batch(args)
     else:
         _logger.info("Running CLI mode")
         run_cli(args)
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # --batch workers in the PyInstaller --onefile build
     main()
\ No newline at end of file
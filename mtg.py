@@ -1,9 +1,22 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from io import BytesIO
+from threading import Lock, get_ident
 from time import perf_counter, sleep
-import json, requests, urllib.parse as up
+import json, requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 from tqdm import tqdm
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib parser is the fallback
+    orjson = None
 from abc import ABC, abstractmethod
 import logging
 
@@ -11,6 +24,8 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+__all__ = ["Downloader", "GUIImageFetcher"]
+
 
 
 HEADERS = {
@@ -18,70 +33,288 @@ HEADERS = {
     "Accept": "application/json;q=0.9,*/*;q=0.8",
 }
 
+# Scryfall image URLs carry the image version as their first path segment
+_IMAGE_VERSION_SEGMENT = re.compile(r"/(?:png|large|normal|small|border_crop|art_crop)/")
+
 CACHE_DIR = Path.home() / ".cache" / "mtgproxy"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
+NAME_INDEX_PATH = CACHE_DIR / "name_index.json"  # lowercased card name -> {format: [[face cache ID, image URL], ...]}
+
+
+def _load_name_index() -> dict[str, list]:
+    """Read the name -> face index, treating a missing or corrupt file as empty."""
+    try:
+        return _json_loads(NAME_INDEX_PATH.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_name_index(index: dict[str, list]):
+    """Atomically replace the name -> face index on disk."""
+    tmp = NAME_INDEX_PATH.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")))
+    os.replace(tmp, NAME_INDEX_PATH)
+
+
+class CacheManager:
+    """Keep a cache directory under a size limit by evicting least recently used files.
+
+    Recency is the file's mtime, which _load_cached refreshes on every
+    first use in a process, so it works on filesystems mounted noatime.
+    Eviction runs at most once per process per manager.
+    """
+
+    CACHE_SUFFIXES = {".jpg", ".png"}   # image entries; the name index is never evicted
+
+    def __init__(self, directory: Path, size_limit: int):
+        self.directory = directory
+        self.size_limit = size_limit
+        self._evicted = False
+        self._lock = Lock()
+
+    def evict_once(self) -> set[str]:
+        """Delete the oldest cache files until the directory fits the limit.
+
+        Returns:
+            Names of the deleted files (empty after the first call)
+        """
+        with self._lock:
+            if self._evicted:
+                return set()
+            self._evicted = True
+
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and os.path.splitext(entry.name)[1] in self.CACHE_SUFFIXES:
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.name))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.size_limit:
+            return set()
+
+        removed = set()
+        for _, size, name in sorted(entries):
+            if total <= self.size_limit:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed.add(name)
+        logger.info(f"Evicted {len(removed)} cached image(s) to keep {self.directory} under {self.size_limit >> 20} MiB")
+        return removed
+
+
+CACHE_SIZE_LIMIT = 2 * 1024 ** 3   # bytes of card images kept in CACHE_DIR
+_cache_manager = CacheManager(CACHE_DIR, CACHE_SIZE_LIMIT)
+
+
+class TokenBucket:
+    """Thread-safe limiter allowing at most `rate` calls per `period` seconds.
+
+    Keeps the timestamps of the most recent calls; a caller that would
+    exceed the budget sleeps until the oldest call leaves the window.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._calls: deque[float] = deque()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Block until another call fits in the budget, then record it."""
+        with self._lock:
+            now = perf_counter()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.rate:
+                sleep(self.period - (now - self._calls[0]))
+                self._calls.popleft()
+                now = perf_counter()
+            self._calls.append(now)
+
+
+SCRYFALL_API = "https://api.scryfall.com"
+SCRYFALL_RATE = 10            # max requests / second, across every fetcher and thread
+_scryfall_limiter = TokenBucket(SCRYFALL_RATE)
 
 
 class BaseScryfallFetcher(ABC):
     """Abstract base class for Scryfall API interaction with rate limiting and caching.
 
     Handles:
-    - Rate limiting (10 requests/second max)
-    - HTTP session management
+    - Rate limiting of api.scryfall.com requests through the module-wide _scryfall_limiter
+    - HTTP session management (one process-wide session, pooled keep-alive connections, retries on 429/5xx)
     - Scryfall API headers
 
     Subclasses must implement:
     - _cache_path(): Return cache file path for a card ID
     """
 
-    RATE = 10                 # max requests / second
-    MIN_DELAY = 1 / RATE
-    _last_call = 0.0
+    STREAM_CHUNK_SIZE = 64 * 1024
+    POOL_MAXSIZE = 32          # keep-alive connections per host, >= download workers
+    RETRY = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),  # /cards/collection is a read-only POST
+    )
+
+    _shared_session: requests.Session | None = None
+    _session_lock = Lock()
 
     def __init__(self):
-        """Initialize Scryfall fetcher with rate-limited session."""
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        """Initialize Scryfall fetcher with the shared rate-limited session."""
+        self.session = self._get_session()
+        self._cached_paths: set[str] = set()
 
-    @staticmethod
-    def _throttle():
-        """Rate limiting to respect Scryfall API limits."""
-        dt = BaseScryfallFetcher.MIN_DELAY - (perf_counter() - BaseScryfallFetcher._last_call)
-        if dt > 0:
-            sleep(dt)
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the session shared by every fetcher, creating it on first use.
+
+        Fetchers are cheap to create (the GUI makes one per search), so
+        sharing the session keeps its keep-alive connections warm between them.
+        """
+        with BaseScryfallFetcher._session_lock:
+            if BaseScryfallFetcher._shared_session is None:
+                session = requests.Session()
+                session.headers.update(HEADERS)
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=cls.POOL_MAXSIZE, max_retries=cls.RETRY)
+                session.mount("https://", adapter)
+                BaseScryfallFetcher._shared_session = session
+            return BaseScryfallFetcher._shared_session
+
+    def _scan_cache(self, directory: Path):
+        """List the cache directory once so cache checks are set lookups, not stat() calls."""
+        self._cached_paths = {entry.path for entry in os.scandir(directory) if entry.is_file()}
+
+    def _in_cache(self, path: str) -> bool:
+        """Whether a cache file was present at the last scan or written since."""
+        return path in self._cached_paths
+
+    def _open_cached(self, path: str, draft_size: tuple[int, int] | None = None) -> Image.Image | None:
+        """Decode a cache entry listed at scan time, or None if it has since been deleted.
+
+        Opening directly instead of checking exists() first saves a stat()
+        and cannot race with eviction or another process clearing the cache.
+        """
+        try:
+            return _load_cached(path, draft_size)
+        except FileNotFoundError:
+            self._cached_paths.discard(path)
+            return None
 
     @staticmethod
-    def _update_last_call():
-        """Update the last call timestamp for rate limiting."""
-        BaseScryfallFetcher._last_call = perf_counter()
+    def _throttle(url: str):
+        """Wait for the shared rate limit if url is on the API host.
+
+        Image URLs point at the cards.scryfall.io CDN, which Scryfall does
+        not rate limit; only api.scryfall.com requests take a token.
+        """
+        if url.startswith(SCRYFALL_API):
+            _scryfall_limiter.acquire()
+
+    def _download_to(self, url: str, path: str, timeout: float = 20):
+        """Stream an image download straight into a cache file.
+
+        The body is written chunk by chunk as it arrives, so it is never
+        buffered in memory or decoded here; callers decode the file
+        afterwards through _load_cached (with draft). The caller is responsible for calling _throttle().
+
+        Args:
+            url: Image URL
+            path: Cache file to write the original bytes to
+            timeout: Request timeout in seconds
+        """
+        tmp = _tmp_path(path)
+        try:
+            with self.session.get(url, timeout=timeout, stream=True) as r, open(tmp, "wb") as out:
+                r.raise_for_status()
+                for chunk in r.iter_content(self.STREAM_CHUNK_SIZE):
+                    out.write(chunk)
+            os.replace(tmp, path)  # Readers only ever see a missing or complete file
+        except BaseException:
+            _unlink(tmp)
+            raise
+        self._cached_paths.add(path)
+
+    def _query_collection(self, names: list[str]) -> dict:
+        """POST up to 75 names to /cards/collection and return the parsed response.
+
+        Args:
+            names: List of card names to query
+
+        Returns:
+            Scryfall response with "data" (found cards, in request order)
+            and "not_found" (the identifiers that did not match)
+        """
+        identifiers = [{"name": n} for n in names]
+        _scryfall_limiter.acquire()
+
+        logger.debug(f"Querying Scryfall for {len(names)} cards")
+        r = self.session.post(
+            f"{SCRYFALL_API}/cards/collection",
+            json={"identifiers": identifiers},
+            timeout=15,
+        )
+        r.raise_for_status()
+        return _json_loads(r.content)  # Parsed once; callers reuse the dict
 
     @abstractmethod
-    def _cache_path(self, scry_id: str) -> Path:
+    def _cache_path(self, scry_id: str) -> str:
         """Return the cache path for a card image. Must be implemented by subclass."""
         pass
 
 
 class Downloader(BaseScryfallFetcher):
-    """Download card images in high-quality PNG format for PDF generation.
+    """Download card images for PDF generation.
 
     Features:
     - Handles multi-face cards (DFC, split, etc.)
-    - PNG format (high quality)
+    - Full-resolution PNG by default, or the ~10x smaller "large" JPEGs on request
     - Bulk collection queries for efficiency
+    - Parallel image downloads; only API requests count against the rate limit
     """
 
-    def __init__(self, cards: dict[str, int]):
+    DOWNLOAD_WORKERS = 16     # concurrent image downloads (CDN GETs are not rate limited)
+
+    # Scryfall image version -> cache suffix
+    IMAGE_FORMATS = {
+        "large": ".jpg",   # 672x936 JPEG
+        "png": ".png",     # 745x1040 PNG
+    }
+
+    def __init__(self, cards: dict[str, int], image_format: str = "png",
+                 draft_size: tuple[int, int] | None = None):
         """Initialize downloader with deck cards.
 
         Args:
             cards: Dictionary of {card_name: quantity}
+            image_format: Scryfall image version to fetch: "png" (745x1040, about
+                1:1 at 300 DPI) or "large" (672x936 JPEG, faster but upscaled when printed)
+            draft_size: Printed card size in pixels; cached JPEGs are decoded
+                at reduced resolution when that is enough to cover it
         """
         super().__init__()
+        if image_format not in self.IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format {image_format!r}, expected one of {list(self.IMAGE_FORMATS)}")
         self.cards = cards
+        self.image_format = image_format
+        self.draft_size = draft_size
+        self._suffix = self.IMAGE_FORMATS[image_format]
+        self._cache_prefix = os.path.join(CACHE_DIR, "")  # Cache paths are built as plain strings
+        self._face_locks: dict[str, Lock] = {}   # cache ID -> lock, so shared faces download once
+        self._face_locks_lock = Lock()
+
+    def _cache_path(self, scry_id: str) -> str:
+        """Return cache path for the configured image format."""
+        return self._cache_prefix + scry_id + self._suffix
 
-    def _cache_path(self, scry_id: str) -> Path:
-        """Return PNG cache path."""
-        return CACHE_DIR / f"{scry_id}.png"
+    def _png_fallback_path(self, scry_id: str) -> str | None:
+        """Return the PNG cache path to fall back to when the configured format is missing."""
+        return self._cache_prefix + scry_id + ".png" if self.image_format != "png" else None
 
     # --------------------------------------------------------- public interface
     def download_all(self) -> list[tuple[Image.Image, int]]:
@@ -91,25 +324,101 @@ class Downloader(BaseScryfallFetcher):
             List of (Image, count) tuples for each card face
         """
         logger.info(f"Starting download of {len(self.cards)} unique cards")
-        imgs: list[tuple[Image.Image, int]] = []
 
+        self._scan_cache(CACHE_DIR)
         card_list = list(self.cards.items())
-        chunks_list = list(chunks(card_list, 75))
 
-        for chunk_idx, chunk in enumerate(tqdm(chunks_list, desc="Downloading card chunks", unit="chunk"), 1):
-            chunk_names = [name for name, _ in chunk]
-            logger.debug(f"Downloading chunk {chunk_idx}/{len(chunks_list)}: {len(chunk)} cards")
-
-            try:
-                data = self._post_collection(chunk_names)
-                for card_json, (card_name, count) in zip(data, chunk):
-                    faces = self._get_card_images(card_json)
-                    for face_img in faces:
-                        imgs.append((face_img, count))
-                    logger.debug(f"Downloaded {card_name} ({len(faces)} face(s))")
-            except Exception as e:
-                logger.error(f"Failed to download chunk {chunk_idx}: {e}")
-                raise
+        # Cards whose faces are all on disk, or have a known image URL, skip the Scryfall round-trip
+        name_index = _load_name_index()
+        resolved: dict[int, list[tuple[str | None, str]]] = {}
+        unresolved: list[int] = []
+        for idx, (card_name, _) in enumerate(card_list):
+            sources = _index_sources(name_index.get(card_name.lower()), self.image_format)
+            if sources and all(url is not None or self._is_cached(cid) for url, cid in sources):
+                resolved[idx] = sources
+            else:
+                unresolved.append(idx)
+        logger.debug(f"{len(resolved)} card(s) resolved from cache index, {len(unresolved)} to query")
+
+        # One slot per card: workers write their card's faces in place, flattened in deck order at the end.
+        # Faces from old index entries carry no URL and must be on disk.
+        card_faces: list[list[tuple[Image.Image, int]] | None] = [None] * len(card_list)
+        queried: dict[int, list[tuple[str, str]]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS) as pool:
+            futures = {}
+
+            def submit(idx: int, sources: list[tuple[str | None, str]]):
+                card_name, count = card_list[idx]
+                futures[pool.submit(self._fill_faces, card_faces, idx, card_name, count, sources)] = idx
+
+            def query(indices: list[int]):
+                """Resolve names (one POST per 75 cards); each chunk's downloads
+                start right away, so the next POST overlaps them."""
+                total_chunks = -(-len(indices) // 75)
+                query_chunks = tqdm(chunks(indices, 75), total=total_chunks, desc="Querying card chunks", unit="chunk")
+                for chunk_idx, chunk in enumerate(query_chunks, 1):
+                    chunk_names = [card_list[idx][0] for idx in chunk]
+                    logger.debug(f"Querying chunk {chunk_idx}/{total_chunks}: {len(chunk)} cards")
+                    try:
+                        card_jsons = self._post_collection(chunk_names)
+                    except Exception as e:
+                        logger.error(f"Failed to query chunk {chunk_idx}: {e}")
+                        pool.shutdown(cancel_futures=True)
+                        raise
+                    for idx, card_json in zip(chunk, card_jsons):
+                        queried[idx] = self._face_sources(card_json)
+                        submit(idx, queried[idx])
+
+            def collect(retry_indexed: bool) -> list[int]:
+                """Wait for submitted cards; return index-resolved cards whose download failed."""
+                pending = dict(futures)
+                futures.clear()
+                stale = []
+                for future in tqdm(as_completed(pending), total=len(pending), desc="Downloading card images", unit="card"):
+                    idx = pending[future]
+                    card_name = card_list[idx][0]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if retry_indexed and idx in resolved:
+                            logger.warning(f"Cached index entry for {card_name} is stale ({e}), re-querying Scryfall")
+                            stale.append(idx)
+                            continue
+                        logger.error(f"Failed to download {card_name}: {e}")
+                        pool.shutdown(cancel_futures=True)
+                        raise
+                    logger.debug(f"Downloaded {card_name} ({len(card_faces[idx])} face(s))")
+                return stale
+
+            for idx, sources in resolved.items():
+                submit(idx, sources)
+            query(unresolved)
+
+            # Stored URLs can go stale (host moves, removed art); drop those entries
+            # before re-querying so a failed retry does not leave them behind
+            if stale := collect(retry_indexed=True):
+                for idx in stale:
+                    key = card_list[idx][0].lower()
+                    if isinstance(entry := name_index.get(key), dict):
+                        entry.pop(self.image_format, None)
+                    else:
+                        name_index.pop(key, None)
+                _save_name_index(name_index)
+                query(stale)
+                collect(retry_indexed=False)
+
+        if queried:
+            for idx, sources in queried.items():
+                key = card_list[idx][0].lower()
+                if not isinstance(entry := name_index.get(key), dict):
+                    entry = name_index[key] = {}  # Replaces a pre-format list entry
+                entry[self.image_format] = [[cid, url] for url, cid in sources]
+            _save_name_index(name_index)
+
+        imgs = [face for faces in card_faces for face in faces]
+        # This deck's faces were just used, so they are the newest and survive eviction
+        self._cached_paths -= {self._cache_prefix + name for name in _cache_manager.evict_once()}
 
         logger.info(f"Successfully downloaded {len(imgs)} card images")
         return imgs
@@ -124,29 +433,18 @@ class Downloader(BaseScryfallFetcher):
         Returns:
             List of card JSON objects from Scryfall
         """
-        identifiers = [{"name": n} for n in names]
-        self._throttle()
-
-        logger.debug(f"Querying Scryfall for {len(names)} cards")
-        r = self.session.post(
-            "https://api.scryfall.com/cards/collection",
-            json={"identifiers": identifiers},
-            timeout=15,
-        )
-        self._update_last_call()
-        r.raise_for_status()
-
-        data = r.json()
-        if data['not_found']:
-            not_found_names = [card['name'] for card in data['not_found']]
+        payload = self._query_collection(names)  # parsed once, reused below
+        if not_found := payload.get("not_found"):
+            not_found_names = [card['name'] for card in not_found]
             logger.warning(f"Scryfall could not find {len(not_found_names)} cards: {not_found_names}")
             raise RuntimeError(f"Could not find these cards: {not_found_names}")
 
-        logger.debug(f"Successfully queried {len(data['data'])} cards from Scryfall")
-        return data["data"]
+        cards = payload["data"]
+        logger.debug(f"Successfully queried {len(cards)} cards from Scryfall")
+        return cards
 
-    def _get_card_images(self, card_json) -> list[Image.Image]:
-        """Return every printable face (front & back) as PIL images.
+    def _face_sources(self, card_json) -> list[tuple[str, str]]:
+        """Return (url, cache_id) for every printable face (front & back).
 
         Handles multi-face cards (DFC, split, MDFC, etc.) by extracting
         images for each printable face.
@@ -155,29 +453,10 @@ class Downloader(BaseScryfallFetcher):
             card_json: Card JSON from Scryfall API
 
         Returns:
-            List of PIL Image objects (one per printable face)
+            List of (image URL, cache ID) tuples (one per printable face)
         """
         card_name = card_json.get("name", "Unknown")
-
-        def _download(url: str, cache_id: str) -> Image.Image:
-            """Download image from URL or use cached version."""
-            cached = self._cache_path(cache_id)
-            if cached.exists():
-                logger.debug(f"Using cached image for {card_name}")
-                return Image.open(cached).convert("RGB")
-
-            logger.debug(f"Downloading image for {card_name}")
-            self._throttle()
-            r = self.session.get(url, timeout=20)
-            self._update_last_call()
-            r.raise_for_status()
-
-            img = Image.open(BytesIO(r.content)).convert("RGB")
-            img.save(cached, "PNG", optimize=True)
-            logger.debug(f"Cached image for {card_name}")
-            return img
-
-        images: list[Image.Image] = []
+        sources: list[tuple[str, str]] = []
 
         # 1️⃣ Prefer explicit faces if present (covers transform, MDFC, split, etc.)
         if faces := card_json.get("card_faces"):
@@ -186,24 +465,157 @@ class Downloader(BaseScryfallFetcher):
                 if "image_uris" not in face:
                     logger.debug(f"Skipping face {idx} of {card_name} (no image available)")
                     continue  # meld-backs, art cards …
-                url = face["image_uris"]["png"]
-                face_id = face.get("id", f"{card_json['id']}-{idx}")
-                images.append(_download(url, face_id))
+                url = face["image_uris"][self.image_format]
+                face_id = face.get("id") or _url_cache_key(url)
+                sources.append((url, face_id))
 
         # 2️⃣ Fallback to single-face object
         elif "image_uris" in card_json:
             logger.debug(f"{card_name} is single-faced")
-            url = card_json["image_uris"]["png"]
-            images.append(_download(url, card_json["id"]))
+            url = card_json["image_uris"][self.image_format]
+            sources.append((url, card_json["id"]))
 
         # 3️⃣ Last-resort redirect (extremely rare)
-        if not images:
+        if not sources:
             logger.warning(f"No image found for {card_name}, using fallback redirect")
-            url = f"https://api.scryfall.com/cards/{card_json['id']}?format=image"
-            images.append(_download(url, card_json["id"]))
+            url = f"{SCRYFALL_API}/cards/{card_json['id']}?format=image&version={self.image_format}"
+            sources.append((url, card_json["id"]))
+
+        return sources
+
+    def _download(self, url: str, cache_id: str, card_name: str) -> Image.Image:
+        """Download image from URL or use cached version.
+
+        Cards sharing a face (tokens, reprints) wait on the same per-face lock,
+        so the image is fetched once and the others get the shared decoded
+        Image from _load_cached.
+        """
+        with self._face_lock(cache_id):
+            if (img := self._read_cache(cache_id)) is not None:
+                logger.debug(f"Using cached image for {card_name}")
+                return img
+
+            logger.debug(f"Downloading image for {card_name}")
+            self._throttle(url)
+            # The CDN already serves the cache format, so store its bytes as-is
+            cached = self._cache_path(cache_id)
+            self._download_to(url, cached)
+            img = _load_cached(cached, self.draft_size)
+            logger.debug(f"Cached image for {card_name}")
+            return img
+
+    def _face_lock(self, cache_id: str) -> Lock:
+        """Return the lock serialising downloads of one face."""
+        with self._face_locks_lock:
+            return self._face_locks.setdefault(cache_id, Lock())
+
+    def _is_cached(self, cache_id: str) -> bool:
+        """Whether a face is on disk in the current format or as a fallback PNG."""
+        fallback = self._png_fallback_path(cache_id)
+        return self._in_cache(self._cache_path(cache_id)) or (fallback is not None and self._in_cache(fallback))
+
+    def _read_cache(self, cache_id: str) -> Image.Image | None:
+        """Load a cached face, falling back to a PNG of the same face.
+
+        PNGs written by png-format runs (or older versions) are used as they
+        are and never deleted or re-encoded, so a later png run still finds them.
+        """
+        cached = self._cache_path(cache_id)
+        if self._in_cache(cached) and (img := self._open_cached(cached, self.draft_size)) is not None:
+            return img
+
+        fallback = self._png_fallback_path(cache_id)
+        if fallback is None or not self._in_cache(fallback):
+            return None
+        return self._open_cached(fallback, self.draft_size)
+
+    def _fill_faces(self, card_faces: list, idx: int, card_name: str, count: int,
+                    sources: list[tuple[str | None, str]]):
+        """Load or download one card's faces into card_faces[idx].
+
+        Every worker owns its own slot of the preallocated list, so no
+        locking or appending is needed.
+        """
+        faces = []
+        for url, cache_id in sources:
+            if url is None:
+                img = self._read_cache(cache_id)
+                if img is None:
+                    raise FileNotFoundError(f"Cached image {cache_id} for {card_name} disappeared")
+            else:
+                img = self._download(url, cache_id, card_name)
+            faces.append((img, count))
+        card_faces[idx] = faces
+
 
-        return images
 # ------------------- utility --------------------------------------------------
+@lru_cache(maxsize=256)
+def _load_cached(path: str, draft_size: tuple[int, int] | None = None) -> Image.Image:
+    """Decode a cached image once per process; callers share the returned Image read-only.
+
+    With draft_size, JPEGs are decoded at the smallest libjpeg scale
+    (1/2, 1/4, 1/8) that still covers that size; other formats ignore it.
+    """
+    img = Image.open(path)
+    try:
+        os.utime(path)  # Mark as recently used for CacheManager eviction
+    except OSError:
+        pass
+    if draft_size is not None:
+        img.draft("RGB", draft_size)
+    img.load()  # Shared across threads, so never hand out a lazily decoding Image
+    return _as_rgb(img)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON with orjson when installed (several times faster on ~500 KB collection responses)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _tmp_path(path: str) -> str:
+    """Per-thread scratch file next to path, for writes finished with os.replace()."""
+    return f"{path}.{os.getpid()}-{get_ident()}.tmp"
+
+
+def _unlink(path: str):
+    """Remove a file if it exists."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _index_sources(entry: dict | list | None, image_format: str) -> list[tuple[str | None, str]]:
+    """Turn a name index entry into (url, cache_id) face sources for one image format.
+
+    Entries are keyed by format because each format has its own URLs and
+    cache files. Older entries are plain lists whose URLs may belong to
+    another format, so they yield url=None and are only served from disk.
+    """
+    if isinstance(entry, dict):
+        return [(url, cache_id) for cache_id, url in entry.get(image_format, ())]
+    return [(None, face if isinstance(face, str) else face[0]) for face in entry or ()]
+
+
+def _url_cache_key(url: str) -> str:
+    """Fixed-length cache key for faces without their own Scryfall ID.
+
+    Keyed on the image URL with its version segment (/png/, /large/, ...)
+    and extension removed, so every format of a face maps to the same ID
+    (the PNG fallback keeps working for DFC faces), faces that share an
+    image share one cache entry, and Scryfall's cache-busting query string
+    still refreshes stale art.
+    """
+    path, _, query = url.partition("?")
+    path = os.path.splitext(_IMAGE_VERSION_SEGMENT.sub("/", path, count=1))[0]
+    return hashlib.blake2b(f"{path}?{query}".encode(), digest_size=8).hexdigest()
+
+
+def _as_rgb(img: Image.Image) -> Image.Image:
+    """Return img in RGB mode, skipping the full-image copy when it already is."""
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+
 def chunks(seq, n):
     for i in range(0, len(seq), n):
         yield seq[i : i + n]
@@ -219,25 +631,36 @@ class GUIImageFetcher(BaseScryfallFetcher):
     """
 
     GUI_CACHE_DIR = Path.home() / ".cache" / "mtgproxy" / "gui_images"
+    PREVIEW_WORKERS = 8       # concurrent preview downloads per 75-card chunk
+    MEMORY_CACHE_SIZE = 256   # decoded previews kept in memory (~500 KB each)
+
+    # Shared by all instances, since the GUI creates a fetcher per search
+    _memory_cache: OrderedDict[str, Image.Image] = OrderedDict()  # lowercased name -> preview
+    _memory_cache_lock = Lock()
+    _shared_cached_paths: set[str] | None = None  # preview directory listing, scanned once per process
+    _scan_lock = Lock()
 
     def __init__(self):
         """Initialize GUI image fetcher."""
         super().__init__()
         self.gui_cache_dir = self.GUI_CACHE_DIR
-        self.gui_cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _cache_path(self, scry_id: str) -> Path:
+        with GUIImageFetcher._scan_lock:
+            if GUIImageFetcher._shared_cached_paths is None:
+                self.gui_cache_dir.mkdir(parents=True, exist_ok=True)
+                self._scan_cache(self.gui_cache_dir)
+                GUIImageFetcher._shared_cached_paths = self._cached_paths
+        # Every fetcher updates the same set as previews are cached or found missing
+        self._cached_paths = GUIImageFetcher._shared_cached_paths
+        self._cache_prefix = os.path.join(self.gui_cache_dir, "")
+
+    def _cache_path(self, scry_id: str) -> str:
         """Get cache path for a card's JPEG image."""
-        return self.gui_cache_dir / f"{scry_id}.jpg"
+        return self._cache_prefix + scry_id + ".jpg"
 
     def fetch_card_image(self, card_name: str) -> Image.Image | None:
         """Fetch a single card image for display in GUI (front face for DFCs).
 
-        Handles multi-face cards (DFC, split, etc.) by using the front face.
-        Attempts to fetch in this order:
-        1. normal format (488x680)
-        2. small format (146x204)
-        3. border_crop format (as fallback)
+        Convenience wrapper around fetch_many() for one card.
 
         Args:
             card_name: Name of the card to fetch (preferably front face only for DFCs)
@@ -245,69 +668,132 @@ class GUIImageFetcher(BaseScryfallFetcher):
         Returns:
             PIL Image of the card, or None if not found or image unavailable
         """
-        try:
-            self._throttle()
-            logger.debug(f"Fetching image for {card_name}")
-
-            # Query Scryfall for the card
-            response = self.session.get(
-                "https://api.scryfall.com/cards/named",
-                params={"exact": card_name},
-                timeout=10
-            )
-            self._update_last_call()
-            response.raise_for_status()
-
-            card_json = response.json()
-
-            # Determine which image_uris to use
-            # 1️⃣ Prefer explicit faces if present (DFC, split, etc.) - use front face only
-            image_uris = None
-            if card_faces := card_json.get("card_faces"):
-                # For GUI, only show front face
-                if card_faces and "image_uris" in card_faces[0]:
-                    image_uris = card_faces[0]["image_uris"]
-                    card_id = card_faces[0].get("id", card_json.get("id", card_name))
-                    logger.debug(f"{card_name} is multi-faced, using front face")
-                # else: meld-backs, art cards, etc. - fall through to below
-
-            # 2️⃣ Fallback to single-face object
-            if not image_uris:
-                image_uris = card_json.get("image_uris", {})
-                card_id = card_json.get("id", card_name)
-
-            # Try multiple formats in order of preference
-            image_url = None
-            for format_name in ["normal", "small", "border_crop"]:
-                if image_uris.get(format_name):
-                    image_url = image_uris[format_name]
-                    logger.debug(f"Using {format_name} format for {card_name}")
-                    break
-
-            if not image_url:
-                # No image available for this card
-                logger.warning(f"No image available for {card_name}")
-                return None
-
-            # Check cache first
-            cached = self._cache_path(card_id)
-            if cached.exists():
-                logger.debug(f"Using cached image for {card_name}")
-                return Image.open(cached).convert("RGB")
+        return self.fetch_many([card_name]).get(card_name)
 
-            # Download the image
-            logger.debug(f"Downloading image for {card_name}")
-            self._throttle()
-            img_response = self.session.get(image_url, timeout=20)
-            self._update_last_call()
-            img_response.raise_for_status()
+    def fetch_many(self, names: list[str]) -> dict[str, Image.Image | None]:
+        """Fetch preview images for many cards with batched Scryfall queries.
 
-            img = Image.open(BytesIO(img_response.content)).convert("RGB")
-            img.save(cached, "JPEG", quality=85, optimize=True)
-            logger.debug(f"Cached image for {card_name}")
+        Previews fetched earlier in this process are served from memory
+        without any request. The rest are resolved 75 at a time through
+        /cards/collection; only images missing from the disk cache are
+        downloaded, in parallel.
+
+        Args:
+            names: Card names to fetch (preferably front face only for DFCs)
+
+        Returns:
+            Dictionary of {requested name: PIL Image or None if not found/unavailable}.
+            Every Image is a private copy the caller may modify (e.g. thumbnail()).
+        """
+        results: dict[str, Image.Image | None] = dict.fromkeys(names)
+        for card_name in results:
+            results[card_name] = self._recall(card_name)
+        missing = [n for n, img in results.items() if img is None]
+
+        for chunk in chunks(missing, 75):
+            try:
+                payload = self._query_collection(chunk)
+            except Exception as e:
+                logger.error(f"Failed to query {len(chunk)} card(s): {e}")
+                continue
+
+            not_found = {card["name"].lower() for card in payload["not_found"] if "name" in card}
+            if not_found:
+                logger.warning(f"Scryfall could not find {len(not_found)} cards: {sorted(not_found)}")
+            found = [n for n in chunk if n.lower() not in not_found]
+
+            # Cache misses are CDN downloads, so fetch the chunk's previews concurrently
+            with ThreadPoolExecutor(max_workers=self.PREVIEW_WORKERS) as pool:
+                futures = {
+                    pool.submit(self._fetch_preview, card_name, card_json): card_name
+                    for card_name, card_json in zip(found, payload["data"])
+                }
+                for future in as_completed(futures):
+                    card_name = futures[future]
+                    try:
+                        results[card_name] = self._remember(card_name, future.result())
+                    except Exception as e:
+                        logger.error(f"Failed to fetch image for {card_name}: {e}")
+
+        # Cached Images are shared process-wide (memory LRU, _load_cached), so never hand them out
+        return {name: img.copy() if img is not None else None for name, img in results.items()}
+
+    @classmethod
+    def _recall(cls, card_name: str) -> Image.Image | None:
+        """Return a preview from the in-memory LRU, or None on a miss."""
+        key = card_name.lower()
+        with cls._memory_cache_lock:
+            if (img := cls._memory_cache.get(key)) is not None:
+                cls._memory_cache.move_to_end(key)
             return img
 
-        except Exception as e:
-            logger.error(f"Failed to fetch image for {card_name}: {e}")
+    @classmethod
+    def _remember(cls, card_name: str, img: Image.Image | None) -> Image.Image | None:
+        """Store a fetched preview in the in-memory LRU and return it.
+
+        Misses (None) are not stored, so unavailable cards are retried.
+        Evicted images are not closed: they may still be shared through
+        _load_cached or held by the GUI.
+        """
+        if img is None:
             return None
+        key = card_name.lower()
+        with cls._memory_cache_lock:
+            cls._memory_cache[key] = img
+            cls._memory_cache.move_to_end(key)
+            while len(cls._memory_cache) > cls.MEMORY_CACHE_SIZE:
+                cls._memory_cache.popitem(last=False)
+        return img
+
+    def _fetch_preview(self, card_name: str, card_json: dict) -> Image.Image | None:
+        """Return the preview image for one card, using the disk cache when possible.
+
+        Handles multi-face cards (DFC, split, etc.) by using the front face.
+        Attempts to fetch in this order:
+        1. normal format (488x680)
+        2. small format (146x204)
+        3. border_crop format (as fallback)
+        """
+        # Determine which image_uris to use
+        # 1️⃣ Prefer explicit faces if present (DFC, split, etc.) - use front face only
+        image_uris = None
+        if card_faces := card_json.get("card_faces"):
+            # For GUI, only show front face
+            if card_faces and "image_uris" in card_faces[0]:
+                image_uris = card_faces[0]["image_uris"]
+                card_id = card_faces[0].get("id", card_json.get("id", card_name))
+                logger.debug(f"{card_name} is multi-faced, using front face")
+            # else: meld-backs, art cards, etc. - fall through to below
+
+        # 2️⃣ Fallback to single-face object
+        if not image_uris:
+            image_uris = card_json.get("image_uris", {})
+            card_id = card_json.get("id", card_name)
+
+        # Try multiple formats in order of preference
+        image_url = None
+        for format_name in ["normal", "small", "border_crop"]:
+            if image_uris.get(format_name):
+                image_url = image_uris[format_name]
+                logger.debug(f"Using {format_name} format for {card_name}")
+                break
+
+        if not image_url:
+            # No image available for this card
+            logger.warning(f"No image available for {card_name}")
+            return None
+
+        # Check cache first
+        cached = self._cache_path(card_id)
+        if self._in_cache(cached) and (img := self._open_cached(cached)) is not None:
+            logger.debug(f"Using cached image for {card_name}")
+            return img
 
+        # Download the image
+        logger.debug(f"Downloading image for {card_name}")
+        self._throttle(image_url)
+        # Scryfall previews are already optimized JPEGs; cache the original bytes
+        self._download_to(image_url, cached)
+        img = _load_cached(cached)
+        logger.debug(f"Cached image for {card_name}")
+        return img